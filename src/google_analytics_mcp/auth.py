@@ -2,27 +2,36 @@
 
 from __future__ import annotations
 
-import json
-
+import orjson
 from google.oauth2.service_account import Credentials
 
 from google_analytics_mcp.config import SCOPES, get_config
 
 
+_credentials: Credentials | None = None
+
+
 def get_credentials() -> Credentials:
-    """Load service account credentials.
+    """Load service account credentials (parsed once, then reused).
 
     Priority:
     1. GA_CREDENTIALS env var (raw JSON string — best for MCP config)
     2. GA_CREDENTIALS_PATH env var or default file path
     """
+    global _credentials
+    if _credentials is None:
+        _credentials = _load_credentials()
+    return _credentials
+
+
+def _load_credentials() -> Credentials:
     cfg = get_config()
 
-    if cfg.credentials_json:
-        info = json.loads(cfg.credentials_json)
+    if cfg.source == "json":
+        info = orjson.loads(cfg.credentials_json)
         return Credentials.from_service_account_info(info, scopes=SCOPES)
 
-    if cfg.credentials_path.exists():
+    if cfg.source == "file":
         return Credentials.from_service_account_file(
             str(cfg.credentials_path), scopes=SCOPES
         )
@@ -81,15 +90,29 @@ class NotConfiguredError(Exception):
         super().__init__(SETUP_GUIDE)
 
 
+_credentials_status: tuple[Credentials, dict] | None = None
+
+
 def check_credentials() -> dict:
-    """Check auth status. Returns a dict with status info."""
+    """Check auth status. Returns a dict with status info.
+
+    The status of a given Credentials object never changes, so it is built once
+    and reused for as long as the same credentials are in use.
+    """
+    global _credentials_status
     try:
         creds = get_credentials()
-        return {
-            "authenticated": True,
-            "service_account_email": creds.service_account_email,
-            "project_id": creds.project_id,
-            "scopes": list(creds.scopes or []),
-        }
     except Exception as e:
         return {"authenticated": False, "reason": str(e)}
+
+    if _credentials_status is None or _credentials_status[0] is not creds:
+        _credentials_status = (
+            creds,
+            {
+                "authenticated": True,
+                "service_account_email": creds.service_account_email,
+                "project_id": creds.project_id,
+                "scopes": list(creds.scopes or []),
+            },
+        )
+    return _credentials_status[1]
@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Literal
 
 SCOPES = [
     "https://www.googleapis.com/auth/analytics.edit",
@@ -14,18 +15,31 @@ SCOPES = [
 DEFAULT_CREDENTIALS_PATH = Path.home() / ".google-analytics-mcp" / "credentials.json"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Config:
     credentials_json: str | None  # raw JSON string from env var
-    credentials_path: Path  # file path fallback
+    credentials_file: str  # file path fallback, as configured (not yet expanded)
+    source: Literal["json", "file", "none"]  # where credentials come from, resolved once
+
+    @property
+    def credentials_path(self) -> Path:
+        return Path(self.credentials_file).expanduser()
 
     @classmethod
     def from_env(cls) -> Config:
+        credentials_json = os.environ.get("GA_CREDENTIALS")
+        credentials_file = os.environ.get("GA_CREDENTIALS_PATH") or str(DEFAULT_CREDENTIALS_PATH)
+        # The key file is only looked at when no inline JSON is configured.
+        if credentials_json:
+            source = "json"
+        elif os.path.exists(os.path.expanduser(credentials_file)):
+            source = "file"
+        else:
+            source = "none"
         return cls(
-            credentials_json=os.environ.get("GA_CREDENTIALS"),
-            credentials_path=Path(
-                os.environ.get("GA_CREDENTIALS_PATH", str(DEFAULT_CREDENTIALS_PATH))
-            ).expanduser(),
+            credentials_json=credentials_json,
+            credentials_file=credentials_file,
+            source=source,
         )
 
 
@@ -4,13 +4,18 @@ from __future__ import annotations
 
 import asyncio
 import functools
-import json
-from typing import Any, Callable, Coroutine
+import inspect
+from typing import Any, Awaitable, Callable, Coroutine
 
+import orjson
 
-def format_json(data: Any) -> str:
-    """Pretty-print a dict/list as JSON text."""
-    return json.dumps(data, indent=2, default=str)
+from google_analytics_mcp.auth import SETUP_GUIDE
+from google_analytics_mcp.config import get_config
+
+
+def format_json(data: Any, pretty: bool = False) -> str:
+    """Serialize a dict/list as compact JSON text (indented if ``pretty``)."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None, default=str).decode()
 
 
 def proto_to_dict(msg: Any) -> dict:
@@ -25,16 +30,62 @@ async def run_sync(fn: Callable, *args: Any, **kwargs: Any) -> Any:
     return await asyncio.to_thread(functools.partial(fn, **kwargs) if kwargs else fn, *args)
 
 
-def with_setup_guide(fn: Callable[..., Coroutine[Any, Any, str]]) -> Callable[..., Coroutine[Any, Any, str]]:
-    """Decorator that catches NotConfiguredError and returns the setup guide."""
+async def run_sync_dict(fn: Callable, *args: Any, **kwargs: Any) -> dict:
+    """Call a sync API method in a thread and convert its proto result there.
+
+    The RPC and the proto -> dict walk share one thread hop, so the response
+    message is never handed back to the event loop just to be converted.
+    """
+
+    def call() -> dict:
+        return proto_to_dict(fn(*args, **kwargs))
+
+    return await run_sync(call)
+
+
+async def run_sync_dicts(fn: Callable, *args: Any, **kwargs: Any) -> list[dict]:
+    """Call a sync list method in a thread and convert every item there.
+
+    Pagers fetch further pages lazily while being iterated, so draining the
+    pager in the same thread also keeps those follow-up RPCs off the event loop.
+    """
+
+    def call() -> list[dict]:
+        return [proto_to_dict(item) for item in fn(*args, **kwargs)]
+
+    return await run_sync(call)
+
+
+def tool_response(
+    empty_message: str | None = None,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Coroutine[Any, Any, str]]]:
+    """Decorator that turns a tool's raw result into its text response.
+
+    The decorated function returns the awaitable from the tools layer, which the
+    wrapper awaits directly, so each call costs a single extra coroutine frame.
+    While credentials are not configured the setup guide is returned without
+    calling the tool at all; otherwise an empty result becomes
+    ``empty_message`` (formatted with the tool's arguments) and anything that is
+    not already a string is JSON-formatted.
+    """
 
-    @functools.wraps(fn)
-    async def wrapper(*args: Any, **kwargs: Any) -> str:
-        from google_analytics_mcp.auth import NotConfiguredError
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Coroutine[Any, Any, str]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> str:
+            # The credential source is resolved once, and "none" is the only way
+            # get_credentials() raises NotConfiguredError: answer with the guide upfront.
+            if get_config().source == "none":
+                return SETUP_GUIDE
+            result = await fn(*args, **kwargs)
+            if not result and empty_message is not None:
+                return empty_message.format(**kwargs)
+            return result if isinstance(result, str) else format_json(result)
 
-        try:
-            return await fn(*args, **kwargs)
-        except NotConfiguredError as e:
-            return str(e)
+        # FastMCP derives the tool schema from the signature: keep fn's parameters
+        # but advertise the text response rather than fn's raw return type.
+        wrapper.__signature__ = inspect.signature(fn, eval_str=True).replace(  # type: ignore[attr-defined]
+            return_annotation=str
+        )
+        return wrapper
 
-    return wrapper
+    return decorator
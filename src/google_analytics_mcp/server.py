@@ -2,21 +2,26 @@
 
 from __future__ import annotations
 
-from typing import Annotated
+import threading
+from typing import Annotated, Awaitable
 
 from mcp.server.fastmcp import FastMCP
 
 from google_analytics_mcp.auth import check_credentials
-from google_analytics_mcp.helpers import format_json, with_setup_guide
-from google_analytics_mcp.tools import admin, data
+from google_analytics_mcp.helpers import format_json, tool_response
 
 mcp = FastMCP("google-analytics")
 
+# Every tool answers with text (JSON or a message), so FastMCP's structured output
+# is skipped: it would build a {"result": str} output model per tool at import and
+# repeat the whole payload in structuredContent on every call.
+tool = mcp.tool(structured_output=False)
+
 
 # ── Auth Tools ──────────────────────────────────────────────────────
 
 
-@mcp.tool()
+@tool
 async def check_auth_status() -> str:
     """Check if the Google Analytics service account is configured and valid."""
     status = check_credentials()
@@ -26,255 +31,263 @@ async def check_auth_status() -> str:
 # ── Admin: Accounts ─────────────────────────────────────────────────
 
 
-@mcp.tool()
-@with_setup_guide
-async def list_accounts() -> str:
+@tool
+@tool_response("No accounts found. Make sure you have access to at least one Google Analytics account.")
+def list_accounts() -> Awaitable[list[dict]]:
     """List all Google Analytics accounts accessible by the authenticated user."""
-    result = await admin.list_accounts()
-    if not result:
-        return "No accounts found. Make sure you have access to at least one Google Analytics account."
-    return format_json(result)
+    from google_analytics_mcp.tools import admin
+
+    return admin.list_accounts()
 
 
 # ── Admin: Properties ───────────────────────────────────────────────
 
 
-@mcp.tool()
-@with_setup_guide
-async def list_properties(
+@tool
+@tool_response("No properties found for account {account_id}.")
+def list_properties(
     account_id: Annotated[str, "The GA account ID (e.g. '123456789')"],
-) -> str:
+) -> Awaitable[list[dict]]:
     """List all GA4 properties for an account."""
-    result = await admin.list_properties(account_id)
-    if not result:
-        return f"No properties found for account {account_id}."
-    return format_json(result)
+    from google_analytics_mcp.tools import admin
+
+    return admin.list_properties(account_id)
 
 
-@mcp.tool()
-@with_setup_guide
-async def create_property(
+@tool
+@tool_response()
+def create_property(
     account_id: Annotated[str, "Parent account ID"],
     display_name: Annotated[str, "Name for the property"],
     time_zone: Annotated[str, "Reporting timezone (IANA format)"] = "Europe/Rome",
     currency_code: Annotated[str, "Currency code"] = "EUR",
-) -> str:
+) -> Awaitable[dict]:
     """Create a new GA4 property."""
-    result = await admin.create_property(account_id, display_name, time_zone, currency_code)
-    return format_json(result)
+    from google_analytics_mcp.tools import admin
+
+    return admin.create_property(account_id, display_name, time_zone, currency_code)
 
 
-@mcp.tool()
-@with_setup_guide
-async def get_property(
+@tool
+@tool_response()
+def get_property(
     property_id: Annotated[str, "The property ID"],
-) -> str:
+) -> Awaitable[dict]:
     """Get details of a GA4 property."""
-    result = await admin.get_property(property_id)
-    return format_json(result)
+    from google_analytics_mcp.tools import admin
+
+    return admin.get_property(property_id)
 
 
-@mcp.tool()
-@with_setup_guide
-async def delete_property(
+@tool
+@tool_response()
+def delete_property(
     property_id: Annotated[str, "The property ID to delete"],
-) -> str:
+) -> Awaitable[dict]:
     """Soft-delete a GA4 property (can be restored within 35 days)."""
-    result = await admin.delete_property(property_id)
-    return format_json(result)
+    from google_analytics_mcp.tools import admin
+
+    return admin.delete_property(property_id)
 
 
 # ── Admin: Data Streams ─────────────────────────────────────────────
 
 
-@mcp.tool()
-@with_setup_guide
-async def list_data_streams(
+@tool
+@tool_response("No data streams found for property {property_id}.")
+def list_data_streams(
     property_id: Annotated[str, "The property ID"],
-) -> str:
+) -> Awaitable[list[dict]]:
     """List all data streams for a GA4 property."""
-    result = await admin.list_data_streams(property_id)
-    if not result:
-        return f"No data streams found for property {property_id}."
-    return format_json(result)
+    from google_analytics_mcp.tools import admin
+
+    return admin.list_data_streams(property_id)
 
 
-@mcp.tool()
-@with_setup_guide
-async def create_web_data_stream(
+@tool
+@tool_response()
+def create_web_data_stream(
     property_id: Annotated[str, "The property ID"],
     default_uri: Annotated[str, "Website URL (e.g. 'https://example.com')"],
     display_name: Annotated[str, "Optional name for this stream"] = "",
-) -> str:
+) -> Awaitable[dict]:
     """Create a web data stream and get the Measurement ID (G-XXXXX)."""
-    result = await admin.create_web_data_stream(property_id, default_uri, display_name)
-    return format_json(result)
+    from google_analytics_mcp.tools import admin
+
+    return admin.create_web_data_stream(property_id, default_uri, display_name)
 
 
-@mcp.tool()
-@with_setup_guide
-async def delete_data_stream(
+@tool
+@tool_response()
+def delete_data_stream(
     property_id: Annotated[str, "The property ID"],
     stream_id: Annotated[str, "The data stream ID"],
-) -> str:
+) -> Awaitable[str]:
     """Delete a data stream."""
-    return await admin.delete_data_stream(property_id, stream_id)
+    from google_analytics_mcp.tools import admin
 
+    return admin.delete_data_stream(property_id, stream_id)
 
-@mcp.tool()
-async def get_tracking_snippet(
+
+@tool
+def get_tracking_snippet(
     measurement_id: Annotated[str, "Measurement ID (e.g. 'G-XXXXXXXXXX')"],
 ) -> str:
     """Generate the gtag.js HTML tracking snippet ready to paste into your website."""
-    return await admin.get_tracking_snippet(measurement_id)
+    from google_analytics_mcp.tools import admin
+
+    return admin.get_tracking_snippet(measurement_id)
 
 
 # ── Admin: Key Events (Conversions) ─────────────────────────────────
 
 
-@mcp.tool()
-@with_setup_guide
-async def list_key_events(
+@tool
+@tool_response("No key events found for property {property_id}.")
+def list_key_events(
     property_id: Annotated[str, "The property ID"],
-) -> str:
+) -> Awaitable[list[dict]]:
     """List key events (conversions) configured for a property."""
-    result = await admin.list_key_events(property_id)
-    if not result:
-        return f"No key events found for property {property_id}."
-    return format_json(result)
+    from google_analytics_mcp.tools import admin
+
+    return admin.list_key_events(property_id)
 
 
-@mcp.tool()
-@with_setup_guide
-async def create_key_event(
+@tool
+@tool_response()
+def create_key_event(
     property_id: Annotated[str, "The property ID"],
     event_name: Annotated[str, "GA4 event name (e.g. 'purchase', 'sign_up')"],
-) -> str:
+) -> Awaitable[dict]:
     """Mark an event as a key event (conversion)."""
-    result = await admin.create_key_event(property_id, event_name)
-    return format_json(result)
+    from google_analytics_mcp.tools import admin
+
+    return admin.create_key_event(property_id, event_name)
 
 
-@mcp.tool()
-@with_setup_guide
-async def delete_key_event(
+@tool
+@tool_response()
+def delete_key_event(
     property_id: Annotated[str, "The property ID"],
     key_event_id: Annotated[str, "The key event resource ID"],
-) -> str:
+) -> Awaitable[str]:
     """Remove an event from key events (conversions)."""
-    return await admin.delete_key_event(property_id, key_event_id)
+    from google_analytics_mcp.tools import admin
+
+    return admin.delete_key_event(property_id, key_event_id)
 
 
 # ── Admin: Custom Dimensions ────────────────────────────────────────
 
 
-@mcp.tool()
-@with_setup_guide
-async def list_custom_dimensions(
+@tool
+@tool_response("No custom dimensions found for property {property_id}.")
+def list_custom_dimensions(
     property_id: Annotated[str, "The property ID"],
-) -> str:
+) -> Awaitable[list[dict]]:
     """List custom dimensions for a property."""
-    result = await admin.list_custom_dimensions(property_id)
-    if not result:
-        return f"No custom dimensions found for property {property_id}."
-    return format_json(result)
+    from google_analytics_mcp.tools import admin
 
+    return admin.list_custom_dimensions(property_id)
 
-@mcp.tool()
-@with_setup_guide
-async def create_custom_dimension(
+
+@tool
+@tool_response()
+def create_custom_dimension(
     property_id: Annotated[str, "The property ID"],
     parameter_name: Annotated[str, "Event parameter name (e.g. 'user_type')"],
     display_name: Annotated[str, "Human-readable name for reports"],
     scope: Annotated[str, "'EVENT' or 'USER'"] = "EVENT",
     description: Annotated[str, "Optional description"] = "",
-) -> str:
+) -> Awaitable[dict]:
     """Create a custom dimension."""
-    result = await admin.create_custom_dimension(
+    from google_analytics_mcp.tools import admin
+
+    return admin.create_custom_dimension(
         property_id, parameter_name, display_name, scope, description
     )
-    return format_json(result)
 
 
 # ── Admin: Custom Metrics ───────────────────────────────────────────
 
 
-@mcp.tool()
-@with_setup_guide
-async def list_custom_metrics(
+@tool
+@tool_response("No custom metrics found for property {property_id}.")
+def list_custom_metrics(
     property_id: Annotated[str, "The property ID"],
-) -> str:
+) -> Awaitable[list[dict]]:
     """List custom metrics for a property."""
-    result = await admin.list_custom_metrics(property_id)
-    if not result:
-        return f"No custom metrics found for property {property_id}."
-    return format_json(result)
+    from google_analytics_mcp.tools import admin
+
+    return admin.list_custom_metrics(property_id)
 
 
-@mcp.tool()
-@with_setup_guide
-async def create_custom_metric(
+@tool
+@tool_response()
+def create_custom_metric(
     property_id: Annotated[str, "The property ID"],
     parameter_name: Annotated[str, "Event parameter name"],
     display_name: Annotated[str, "Human-readable name"],
     scope: Annotated[str, "'EVENT'"] = "EVENT",
     measurement_unit: Annotated[str, "'STANDARD', 'CURRENCY', 'FEET', 'METERS', 'KILOMETERS', 'MILES', 'MILLISECONDS', 'SECONDS', 'MINUTES', 'HOURS'"] = "STANDARD",
     description: Annotated[str, "Optional description"] = "",
-) -> str:
+) -> Awaitable[dict]:
     """Create a custom metric."""
-    result = await admin.create_custom_metric(
+    from google_analytics_mcp.tools import admin
+
+    return admin.create_custom_metric(
         property_id, parameter_name, display_name, scope, measurement_unit, description
     )
-    return format_json(result)
 
 
 # ── Admin: Google Ads Links ─────────────────────────────────────────
 
 
-@mcp.tool()
-@with_setup_guide
-async def list_google_ads_links(
+@tool
+@tool_response("No Google Ads links found for property {property_id}.")
+def list_google_ads_links(
     property_id: Annotated[str, "The property ID"],
-) -> str:
+) -> Awaitable[list[dict]]:
     """List Google Ads links for a property."""
-    result = await admin.list_google_ads_links(property_id)
-    if not result:
-        return f"No Google Ads links found for property {property_id}."
-    return format_json(result)
+    from google_analytics_mcp.tools import admin
+
+    return admin.list_google_ads_links(property_id)
 
 
-@mcp.tool()
-@with_setup_guide
-async def create_google_ads_link(
+@tool
+@tool_response()
+def create_google_ads_link(
     property_id: Annotated[str, "The property ID"],
     customer_id: Annotated[str, "Google Ads customer ID (e.g. '123-456-7890')"],
-) -> str:
+) -> Awaitable[dict]:
     """Link a Google Ads account to a GA4 property."""
-    result = await admin.create_google_ads_link(property_id, customer_id)
-    return format_json(result)
+    from google_analytics_mcp.tools import admin
+
+    return admin.create_google_ads_link(property_id, customer_id)
 
 
 # ── Admin: Measurement Protocol ─────────────────────────────────────
 
 
-@mcp.tool()
-@with_setup_guide
-async def get_measurement_protocol_secret(
+@tool
+@tool_response()
+def get_measurement_protocol_secret(
     property_id: Annotated[str, "The property ID"],
     stream_id: Annotated[str, "The data stream ID"],
     display_name: Annotated[str, "Name for the secret if creating new"] = "MCP Server",
-) -> str:
+) -> Awaitable[dict]:
     """Get or create a Measurement Protocol API secret for server-side event tracking."""
-    result = await admin.get_measurement_protocol_secret(property_id, stream_id, display_name)
-    return format_json(result)
+    from google_analytics_mcp.tools import admin
+
+    return admin.get_measurement_protocol_secret(property_id, stream_id, display_name)
 
 
 # ── Data: Reports ───────────────────────────────────────────────────
 
 
-@mcp.tool()
-@with_setup_guide
-async def run_report(
+@tool
+@tool_response()
+def run_report(
     property_id: Annotated[str, "The property ID"],
     dimensions: Annotated[list[str], "List of dimension names (e.g. ['country', 'city'])"],
     metrics: Annotated[list[str], "List of metric names (e.g. ['activeUsers', 'sessions'])"],
@@ -282,44 +295,124 @@ async def run_report(
     end_date: Annotated[str, "End date (same format)"] = "today",
     dimension_filter_name: Annotated[str | None, "Optional dimension to filter on"] = None,
     dimension_filter_value: Annotated[str | None, "Value for the dimension filter (exact match)"] = None,
-    limit: Annotated[int, "Max rows (default 100)"] = 100,
+    limit: Annotated[int, "Max rows (default 100, at most 250000)"] = 100,
     offset: Annotated[int, "Row offset for pagination"] = 0,
-) -> str:
+    order_bys: Annotated[list[str] | None, "Optional metrics to sort by, descending (e.g. ['sessions'])"] = None,
+    columnar: Annotated[bool, "Return {header: [values...]} columns instead of one object per row"] = False,
+    cast_metrics: Annotated[bool, "Convert metric values to numbers (false keeps the API's strings)"] = True,
+    use_cache: Annotated[bool, "Set to false to bypass the 5-minute cache for completed date ranges"] = True,
+    max_tries: Annotated[int, "Attempts (1-10) before giving up on rate-limit (429) or unavailable errors"] = 5,
+) -> Awaitable[dict]:
     """Run a GA4 report with dimensions, metrics, date range, and optional filters."""
-    result = await data.run_report(
+    from google_analytics_mcp.tools import data
+
+    return data.run_report(
         property_id, dimensions, metrics, start_date, end_date,
-        dimension_filter_name, dimension_filter_value, limit, offset,
+        dimension_filter_name, dimension_filter_value, limit, offset, order_bys, columnar,
+        cast_metrics=cast_metrics, use_cache=use_cache, max_tries=max_tries,
     )
-    return format_json(result)
 
 
-@mcp.tool()
-@with_setup_guide
-async def run_realtime_report(
+@tool
+@tool_response()
+def run_report_paged(
+    property_id: Annotated[str, "The property ID"],
+    dimensions: Annotated[list[str], "List of dimension names (e.g. ['country', 'city'])"],
+    metrics: Annotated[list[str], "List of metric names (e.g. ['activeUsers', 'sessions'])"],
+    start_date: Annotated[str, "Start date ('YYYY-MM-DD', 'NdaysAgo', 'yesterday', 'today')"] = "28daysAgo",
+    end_date: Annotated[str, "End date (same format)"] = "today",
+    dimension_filter_name: Annotated[str | None, "Optional dimension to filter on"] = None,
+    dimension_filter_value: Annotated[str | None, "Value for the dimension filter (exact match)"] = None,
+    order_bys: Annotated[list[str] | None, "Metrics to sort by, descending; keeps row order stable across pages"] = None,
+    page_size: Annotated[int, "Rows per API request (at most 250000)"] = 100000,
+    max_concurrency: Annotated[int, "Max page requests in flight at once"] = 5,
+    columnar: Annotated[bool, "Return {header: [values...]} columns instead of one object per row"] = False,
+    cast_metrics: Annotated[bool, "Convert metric values to numbers (false keeps the API's strings)"] = True,
+    max_tries: Annotated[int, "Attempts (1-10) before giving up on rate-limit (429) or unavailable errors"] = 5,
+) -> Awaitable[dict]:
+    """Run a GA4 report and return every row, fetching pages concurrently."""
+    from google_analytics_mcp.tools import data
+
+    return data.run_report_paged(
+        property_id, dimensions, metrics, start_date, end_date,
+        dimension_filter_name, dimension_filter_value, order_bys, page_size, max_concurrency, columnar,
+        cast_metrics, max_tries=max_tries,
+    )
+
+
+@tool
+@tool_response()
+def batch_run_reports(
+    property_id: Annotated[str, "The property ID"],
+    reports: Annotated[list[dict], "Reports to run, each with 'dimensions' and 'metrics' and optionally 'start_date', 'end_date', 'dimension_filter_name', 'dimension_filter_value', 'limit', 'offset', 'order_bys'"],
+    columnar: Annotated[bool, "Return {header: [values...]} columns instead of one object per row"] = False,
+    cast_metrics: Annotated[bool, "Convert metric values to numbers (false keeps the API's strings)"] = True,
+    max_tries: Annotated[int, "Attempts (1-10) before giving up on rate-limit (429) or unavailable errors"] = 5,
+) -> Awaitable[list[dict]]:
+    """Run several GA4 reports for one property in a single batched call (5 reports per API request)."""
+    from google_analytics_mcp.tools import data
+
+    return data.batch_run_reports(property_id, reports, columnar, cast_metrics, max_tries)
+
+
+@tool
+@tool_response()
+def run_reports_many(
+    jobs: Annotated[list[dict], "Reports to run, each with 'property_id', 'dimensions' and 'metrics' and optionally 'start_date', 'end_date', 'dimension_filter_name', 'dimension_filter_value', 'limit', 'offset', 'order_bys'"],
+    max_concurrency: Annotated[int, "Max reports in flight at once"] = 10,
+    columnar: Annotated[bool, "Return {header: [values...]} columns instead of one object per row"] = False,
+    cast_metrics: Annotated[bool, "Convert metric values to numbers (false keeps the API's strings)"] = True,
+    max_tries: Annotated[int, "Attempts (1-10) before giving up on rate-limit (429) or unavailable errors"] = 5,
+) -> Awaitable[list[dict]]:
+    """Run many GA4 reports concurrently, e.g. the same report across several properties."""
+    from google_analytics_mcp.tools import data
+
+    return data.run_reports_many(jobs, max_concurrency, columnar, cast_metrics, max_tries)
+
+
+@tool
+@tool_response()
+def run_realtime_report(
     property_id: Annotated[str, "The property ID"],
     dimensions: Annotated[list[str] | None, "Optional real-time dimensions"] = None,
     metrics: Annotated[list[str] | None, "Optional real-time metrics (default: ['activeUsers'])"] = None,
-) -> str:
+    columnar: Annotated[bool, "Return {header: [values...]} columns instead of one object per row"] = False,
+    cast_metrics: Annotated[bool, "Convert metric values to numbers (false keeps the API's strings)"] = True,
+    max_tries: Annotated[int, "Attempts (1-10) before giving up on rate-limit (429) or unavailable errors"] = 5,
+) -> Awaitable[dict]:
     """Run a real-time report showing active users and live events."""
-    result = await data.run_realtime_report(property_id, dimensions, metrics)
-    return format_json(result)
+    from google_analytics_mcp.tools import data
+
+    return data.run_realtime_report(property_id, dimensions, metrics, columnar, cast_metrics, max_tries)
 
 
-@mcp.tool()
-@with_setup_guide
-async def get_metadata(
+@tool
+@tool_response()
+def get_metadata(
     property_id: Annotated[str, "The property ID"],
-) -> str:
+    include_descriptions: Annotated[bool, "Also return each field's description and category"] = False,
+    use_cache: Annotated[bool, "Set to false to bypass the 5-minute cache"] = True,
+    max_tries: Annotated[int, "Attempts (1-10) before giving up on rate-limit (429) or unavailable errors"] = 5,
+) -> Awaitable[dict]:
     """List all available dimensions and metrics for a GA4 property.
 
     Useful to discover which dimension/metric names you can use in run_report.
     """
-    result = await data.get_metadata(property_id)
-    return format_json(result)
+    from google_analytics_mcp.tools import data
+
+    return data.get_metadata(property_id, include_descriptions, use_cache, max_tries)
 
 
 # ── Entry Point ─────────────────────────────────────────────────────
 
 
+def _warm_up() -> None:
+    from google_analytics_mcp.tools import admin
+
+    admin.warm_up()
+
+
 def main() -> None:
+    # Import the Admin API client and open its channel while the client handshakes.
+    threading.Thread(target=_warm_up, name="ga-warm-up", daemon=True).start()
     mcp.run(transport="stdio")
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+
+import grpc
 from google.analytics.admin_v1beta import AnalyticsAdminServiceClient
 from google.analytics.admin_v1beta.types import (
     CreateCustomDimensionRequest,
@@ -23,11 +27,44 @@ from google.analytics.admin_v1beta.types import (
 )
 
 from google_analytics_mcp.auth import get_credentials
-from google_analytics_mcp.helpers import proto_to_dict, run_sync
+from google_analytics_mcp.helpers import proto_to_dict, run_sync, run_sync_dict, run_sync_dicts
+
+
+# Enum name -> value maps, resolved once at import instead of per create call.
+_DIMENSION_SCOPES = {scope.name: scope for scope in CustomDimension.DimensionScope}
+_METRIC_SCOPES = {scope.name: scope for scope in CustomMetric.MetricScope}
+_MEASUREMENT_UNITS = {unit.name: unit for unit in CustomMetric.MeasurementUnit}
+
+_admin_client: AnalyticsAdminServiceClient | None = None
+_admin_client_lock = threading.Lock()
 
 
 def _client() -> AnalyticsAdminServiceClient:
-    return AnalyticsAdminServiceClient(credentials=get_credentials())
+    global _admin_client
+    if _admin_client is None:
+        # warm_up() may be building the client on a background thread.
+        with _admin_client_lock:
+            if _admin_client is None:
+                _admin_client = AnalyticsAdminServiceClient(credentials=get_credentials())
+    return _admin_client
+
+
+def warm_up(timeout: float = 10.0) -> None:
+    """Build the client and connect its gRPC channel ahead of the first tool call.
+
+    Best-effort: if credentials are missing or invalid it does nothing and the
+    first tool call reports the error; a channel that is not ready within
+    ``timeout`` seconds is simply left to finish connecting on first use.
+    """
+    try:
+        client = _client()
+    except Exception:
+        return
+    ready = grpc.channel_ready_future(client.transport.grpc_channel)
+    try:
+        ready.result(timeout=timeout)
+    except grpc.FutureTimeoutError:
+        ready.cancel()
 
 
 # ── Accounts ────────────────────────────────────────────────────────
@@ -36,8 +73,7 @@ def _client() -> AnalyticsAdminServiceClient:
 async def list_accounts() -> list[dict]:
     """List all Google Analytics accounts accessible by the authenticated user."""
     client = _client()
-    pages = await run_sync(client.list_accounts)
-    return [proto_to_dict(a) for a in pages]
+    return await run_sync_dicts(client.list_accounts)
 
 
 # ── Properties ──────────────────────────────────────────────────────
@@ -51,8 +87,7 @@ async def list_properties(account_id: str) -> list[dict]:
     """
     client = _client()
     request = ListPropertiesRequest(filter=f"parent:accounts/{account_id}")
-    pages = await run_sync(client.list_properties, request=request)
-    return [proto_to_dict(p) for p in pages]
+    return await run_sync_dicts(client.list_properties, request=request)
 
 
 async def create_property(
@@ -76,8 +111,7 @@ async def create_property(
         time_zone=time_zone,
         currency_code=currency_code,
     )
-    result = await run_sync(client.create_property, request=CreatePropertyRequest(property=prop))
-    return proto_to_dict(result)
+    return await run_sync_dict(client.create_property, request=CreatePropertyRequest(property=prop))
 
 
 async def get_property(property_id: str) -> dict:
@@ -87,8 +121,7 @@ async def get_property(property_id: str) -> dict:
         property_id: The property ID (e.g. "123456789").
     """
     client = _client()
-    result = await run_sync(client.get_property, name=f"properties/{property_id}")
-    return proto_to_dict(result)
+    return await run_sync_dict(client.get_property, name=f"properties/{property_id}")
 
 
 async def delete_property(property_id: str) -> dict:
@@ -98,8 +131,7 @@ async def delete_property(property_id: str) -> dict:
         property_id: The property ID to delete.
     """
     client = _client()
-    result = await run_sync(client.delete_property, name=f"properties/{property_id}")
-    return proto_to_dict(result)
+    return await run_sync_dict(client.delete_property, name=f"properties/{property_id}")
 
 
 # ── Data Streams ────────────────────────────────────────────────────
@@ -112,8 +144,7 @@ async def list_data_streams(property_id: str) -> list[dict]:
         property_id: The property ID.
     """
     client = _client()
-    pages = await run_sync(client.list_data_streams, parent=f"properties/{property_id}")
-    return [proto_to_dict(s) for s in pages]
+    return await run_sync_dicts(client.list_data_streams, parent=f"properties/{property_id}")
 
 
 async def create_web_data_stream(
@@ -134,14 +165,13 @@ async def create_web_data_stream(
         display_name=display_name or default_uri,
         web_stream_data=DataStream.WebStreamData(default_uri=default_uri),
     )
-    result = await run_sync(
+    return await run_sync_dict(
         client.create_data_stream,
         request=CreateDataStreamRequest(
             parent=f"properties/{property_id}",
             data_stream=stream,
         ),
     )
-    return proto_to_dict(result)
 
 
 async def delete_data_stream(property_id: str, stream_id: str) -> str:
@@ -159,7 +189,7 @@ async def delete_data_stream(property_id: str, stream_id: str) -> str:
     return f"Data stream {stream_id} deleted."
 
 
-async def get_tracking_snippet(measurement_id: str) -> str:
+def get_tracking_snippet(measurement_id: str) -> str:
     """Generate the gtag.js tracking snippet for a given Measurement ID.
 
     Args:
@@ -186,8 +216,7 @@ async def list_key_events(property_id: str) -> list[dict]:
         property_id: The property ID.
     """
     client = _client()
-    pages = await run_sync(client.list_key_events, parent=f"properties/{property_id}")
-    return [proto_to_dict(e) for e in pages]
+    return await run_sync_dicts(client.list_key_events, parent=f"properties/{property_id}")
 
 
 async def create_key_event(property_id: str, event_name: str) -> dict:
@@ -199,14 +228,13 @@ async def create_key_event(property_id: str, event_name: str) -> dict:
     """
     client = _client()
     key_event = KeyEvent(event_name=event_name)
-    result = await run_sync(
+    return await run_sync_dict(
         client.create_key_event,
         request=CreateKeyEventRequest(
             key_event=key_event,
             parent=f"properties/{property_id}",
         ),
     )
-    return proto_to_dict(result)
 
 
 async def delete_key_event(property_id: str, key_event_id: str) -> str:
@@ -234,8 +262,7 @@ async def list_custom_dimensions(property_id: str) -> list[dict]:
         property_id: The property ID.
     """
     client = _client()
-    pages = await run_sync(client.list_custom_dimensions, parent=f"properties/{property_id}")
-    return [proto_to_dict(d) for d in pages]
+    return await run_sync_dicts(client.list_custom_dimensions, parent=f"properties/{property_id}")
 
 
 async def create_custom_dimension(
@@ -258,17 +285,16 @@ async def create_custom_dimension(
     dim = CustomDimension(
         parameter_name=parameter_name,
         display_name=display_name,
-        scope=CustomDimension.DimensionScope[scope],
+        scope=_DIMENSION_SCOPES[scope],
         description=description,
     )
-    result = await run_sync(
+    return await run_sync_dict(
         client.create_custom_dimension,
         request=CreateCustomDimensionRequest(
             parent=f"properties/{property_id}",
             custom_dimension=dim,
         ),
     )
-    return proto_to_dict(result)
 
 
 # ── Custom Metrics ─────────────────────────────────────────────────
@@ -281,8 +307,7 @@ async def list_custom_metrics(property_id: str) -> list[dict]:
         property_id: The property ID.
     """
     client = _client()
-    pages = await run_sync(client.list_custom_metrics, parent=f"properties/{property_id}")
-    return [proto_to_dict(m) for m in pages]
+    return await run_sync_dicts(client.list_custom_metrics, parent=f"properties/{property_id}")
 
 
 async def create_custom_metric(
@@ -307,18 +332,17 @@ async def create_custom_metric(
     metric = CustomMetric(
         parameter_name=parameter_name,
         display_name=display_name,
-        scope=CustomMetric.MetricScope[scope],
-        measurement_unit=CustomMetric.MeasurementUnit[measurement_unit],
+        scope=_METRIC_SCOPES[scope],
+        measurement_unit=_MEASUREMENT_UNITS[measurement_unit],
         description=description,
     )
-    result = await run_sync(
+    return await run_sync_dict(
         client.create_custom_metric,
         request=CreateCustomMetricRequest(
             parent=f"properties/{property_id}",
             custom_metric=metric,
         ),
     )
-    return proto_to_dict(result)
 
 
 # ── Google Ads Links ───────────────────────────────────────────────
@@ -331,8 +355,7 @@ async def list_google_ads_links(property_id: str) -> list[dict]:
         property_id: The property ID.
     """
     client = _client()
-    pages = await run_sync(client.list_google_ads_links, parent=f"properties/{property_id}")
-    return [proto_to_dict(link) for link in pages]
+    return await run_sync_dicts(client.list_google_ads_links, parent=f"properties/{property_id}")
 
 
 async def create_google_ads_link(property_id: str, customer_id: str) -> dict:
@@ -344,19 +367,46 @@ async def create_google_ads_link(property_id: str, customer_id: str) -> dict:
     """
     client = _client()
     link = GoogleAdsLink(customer_id=customer_id)
-    result = await run_sync(
+    return await run_sync_dict(
         client.create_google_ads_link,
         request=CreateGoogleAdsLinkRequest(
             parent=f"properties/{property_id}",
             google_ads_link=link,
         ),
     )
-    return proto_to_dict(result)
 
 
 # ── Measurement Protocol Secret ────────────────────────────────────
 
 
+# Secrets already handed out, served straight from here on repeat calls while a
+# background task re-lists them (stale-while-revalidate).
+_secrets: dict[tuple[str, str], dict] = {}
+_secret_refreshes: dict[tuple[str, str], asyncio.Task] = {}
+
+
+def _first_secret(client: AnalyticsAdminServiceClient, parent: str) -> dict | None:
+    """Return the first existing secret, fetching only the first page."""
+    pager = client.list_measurement_protocol_secrets(
+        request=ListMeasurementProtocolSecretsRequest(parent=parent),
+    )
+    secret = next(iter(pager), None)
+    return proto_to_dict(secret) if secret is not None else None
+
+
+async def _refresh_secret(key: tuple[str, str], parent: str) -> None:
+    try:
+        secret = await run_sync(_first_secret, _client(), parent)
+    except Exception:
+        return  # keep serving the cached secret, the next call retries
+    finally:
+        _secret_refreshes.pop(key, None)
+    if secret is None:
+        _secrets.pop(key, None)
+    else:
+        _secrets[key] = secret
+
+
 async def get_measurement_protocol_secret(
     property_id: str,
     stream_id: str,
@@ -369,25 +419,27 @@ async def get_measurement_protocol_secret(
         stream_id: The data stream ID.
         display_name: Name for the secret if a new one is created.
     """
-    client = _client()
+    key = (property_id, stream_id)
     parent = f"properties/{property_id}/dataStreams/{stream_id}"
 
+    cached = _secrets.get(key)
+    if cached is not None:
+        if key not in _secret_refreshes:
+            _secret_refreshes[key] = asyncio.create_task(_refresh_secret(key, parent))
+        return cached
+
+    client = _client()
+
     # Try to find existing
-    pages = await run_sync(
-        client.list_measurement_protocol_secrets,
-        request=ListMeasurementProtocolSecretsRequest(parent=parent),
-    )
-    secrets = [proto_to_dict(s) for s in pages]
-    if secrets:
-        return secrets[0]
-
-    # Create new
-    secret = MeasurementProtocolSecret(display_name=display_name)
-    result = await run_sync(
-        client.create_measurement_protocol_secret,
-        request=CreateMeasurementProtocolSecretRequest(
-            parent=parent,
-            measurement_protocol_secret=secret,
-        ),
-    )
-    return proto_to_dict(result)
+    secret = await run_sync(_first_secret, client, parent)
+    if secret is None:
+        # Create new
+        secret = await run_sync_dict(
+            client.create_measurement_protocol_secret,
+            request=CreateMeasurementProtocolSecretRequest(
+                parent=parent,
+                measurement_protocol_secret=MeasurementProtocolSecret(display_name=display_name),
+            ),
+        )
+    _secrets[key] = secret
+    return secret
@@ -2,46 +2,236 @@
 
 from __future__ import annotations
 
-from google.analytics.data_v1beta import BetaAnalyticsDataClient
+import asyncio
+import logging
+import os
+import random
+import re
+import stat
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from itertools import repeat
+from sys import intern
+from typing import IO, Any, AsyncIterator, Awaitable, Callable, Iterable, TypeVar
+
+import orjson
+from google.analytics.data_v1beta import BetaAnalyticsDataAsyncClient
 from google.analytics.data_v1beta.types import (
+    BatchRunReportsRequest,
     DateRange,
     Dimension,
     Filter,
     FilterExpression,
     GetMetadataRequest,
     Metric,
+    MetricType,
+    OrderBy,
     RunRealtimeReportRequest,
     RunReportRequest,
 )
+from google.api_core.exceptions import GoogleAPICallError, ResourceExhausted, ServiceUnavailable
+from google.protobuf.internal import api_implementation
+from google.rpc.error_details_pb2 import RetryInfo
 
 from google_analytics_mcp.auth import get_credentials
 from google_analytics_mcp.helpers import run_sync
 
 
-def _client() -> BetaAnalyticsDataClient:
-    return BetaAnalyticsDataClient(credentials=get_credentials())
+# Report formatting walks every row and cell of the response; with the pure-Python
+# protobuf runtime that is an order of magnitude slower than with upb or cpp.
+if api_implementation.Type() == "python":
+    logging.getLogger(__name__).warning(
+        "protobuf is using the pure-Python implementation; large reports will be slow. "
+        "Install a protobuf wheel for your platform and unset "
+        "PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION."
+    )
 
 
-def _format_report(response) -> dict:
-    """Format a report response into a readable dict."""
-    headers = [h.name for h in response.dimension_headers] + [
-        h.name for h in response.metric_headers
-    ]
-    rows = []
-    for row in response.rows:
-        values = [v.value for v in row.dimension_values] + [
-            v.value for v in row.metric_values
-        ]
-        rows.append(dict(zip(headers, values)))
+# The async client's gRPC channel belongs to the event loop it was created on.
+_data_client: tuple[asyncio.AbstractEventLoop, BetaAnalyticsDataAsyncClient] | None = None
+
+
+def _client() -> BetaAnalyticsDataAsyncClient:
+    global _data_client
+    loop = asyncio.get_running_loop()
+    if _data_client is None or _data_client[0] is not loop:
+        _data_client = (loop, BetaAnalyticsDataAsyncClient(credentials=get_credentials()))
+    return _data_client[1]
+
+
+_T = TypeVar("_T")
+
+
+def _retry_delay(exc: GoogleAPICallError) -> float | None:
+    """The server-suggested wait from a RetryInfo error detail, if any."""
+    for detail in exc.details:
+        if isinstance(detail, RetryInfo):
+            return detail.retry_delay.ToTimedelta().total_seconds()
+    return None
+
+
+# Bounds on retrying, so one tool call cannot wait for hours.
+_MAX_TRIES = 10
+_MAX_BACKOFF = 30.0
+
+
+async def _with_retry(
+    call: Callable[[], Awaitable[_T]], max_tries: int = 5, base: float = 0.5
+) -> _T:
+    """Await ``call()``, retrying with exponential backoff on quota/availability errors.
+
+    Each wait, including a server-suggested one, is capped at _MAX_BACKOFF seconds.
+    """
+    if not 1 <= max_tries <= _MAX_TRIES:
+        raise ValueError(f"max_tries must be between 1 and {_MAX_TRIES}, got {max_tries}.")
+    for attempt in range(max_tries - 1):
+        try:
+            return await call()
+        except (ResourceExhausted, ServiceUnavailable) as e:
+            delay = _retry_delay(e)
+            if delay is None:
+                delay = base * 2**attempt
+            await asyncio.sleep(min(delay, _MAX_BACKOFF) + random.random() * 0.1)
+    return await call()
+
+
+# Short-lived cache for responses that do not change from one call to the next:
+# property metadata and reports whose date range has ended. Values are shared
+# between callers and must not be mutated. Reports larger than _CACHE_MAX_ROWS
+# (bulk exports, paged fetches) are not kept. {key: (expires_at, result)}
+_CACHE_TTL = 300.0
+_CACHE_MAX_ENTRIES = 256
+_CACHE_MAX_ROWS = 10_000
+_cache: dict[tuple, tuple[float, dict]] = {}
+
+_DAYS_AGO = re.compile(r"(\d+)daysAgo")
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _cache_get(key: tuple) -> dict | None:
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at < time.monotonic():
+        del _cache[key]
+        return None
+    return value
+
+
+def _cache_set(key: tuple, value: dict) -> None:
+    now = time.monotonic()
+    if len(_cache) >= _CACHE_MAX_ENTRIES:
+        for k in [k for k, (expires_at, _) in _cache.items() if expires_at < now]:
+            del _cache[k]
+        if len(_cache) >= _CACHE_MAX_ENTRIES:
+            del _cache[next(iter(_cache))]  # oldest entry
+    _cache[key] = (now + _CACHE_TTL, value)
+
+
+def _is_live(end_date: str) -> bool:
+    """Whether a report ending on ``end_date`` can still change (today or yesterday)."""
+    if end_date in ("today", "yesterday"):
+        return True
+    if match := _DAYS_AGO.fullmatch(end_date):
+        return int(match.group(1)) <= 1
+    if _ISO_DATE.fullmatch(end_date):
+        return end_date >= (date.today() - timedelta(days=1)).isoformat()
+    return True
+
+
+def _cast_values(casts: Iterable[Callable[[str], Any]], values: list[str]) -> list:
+    """Apply per-value casts, keeping any value that does not parse as a string."""
+    try:
+        return [cast(v) for cast, v in zip(casts, values)]
+    except ValueError:
+        pass
+    converted = []
+    for cast, v in zip(casts, values):
+        try:
+            converted.append(cast(v))
+        except ValueError:
+            converted.append(v)
+    return converted
+
+
+def _headers_and_casts(pb, cast_metrics: bool) -> tuple[list[str], list | None]:
+    """Column names of a raw report message and, if requested, its metric casts."""
+    headers = [h.name for h in pb.dimension_headers]
+    headers.extend(h.name for h in pb.metric_headers)
+    casts = None
+    if cast_metrics:
+        casts = [int if h.type_ == MetricType.TYPE_INTEGER else float for h in pb.metric_headers]
+    return headers, casts
+
+
+def _row_values(row, casts: list | None) -> list:
+    """Values of a raw report row in header order: interned dimensions, then metrics."""
+    values = [intern(v.value) for v in row.dimension_values]
+    metric_values = [v.value for v in row.metric_values]
+    values.extend(_cast_values(casts, metric_values) if casts else metric_values)
+    return values
+
+
+def _format_report(response, columnar: bool = False, cast_metrics: bool = True) -> dict:
+    """Format a report response into a readable dict.
+
+    By default each row becomes a {header: value} dict. With ``columnar`` the
+    values are returned per header instead ({header: [values...]}), which avoids
+    repeating every header name on every row. With ``cast_metrics`` metric values
+    are converted from the API's strings to int (TYPE_INTEGER) or float.
+
+    Dimension values are interned: they repeat heavily across rows ("US",
+    "mobile", ...) and cached results keep them alive.
+    """
+    # Read the raw protobuf message: going through the proto-plus wrappers
+    # marshals a new wrapper object for every row and cell.
+    pb = response._pb
+    headers, casts = _headers_and_casts(pb, cast_metrics)
+    n = len(pb.rows)
+    # row_count is the total matching rows; fall back to the rows returned
+    # if the server left it unset.
+    row_count = pb.row_count or n
+
+    if columnar:
+        n_dims = len(pb.dimension_headers)
+        columns = {}
+        for j, name in enumerate(headers[:n_dims]):
+            columns[name] = [intern(row.dimension_values[j].value) for row in pb.rows]
+        for j, name in enumerate(headers[n_dims:]):
+            column = [row.metric_values[j].value for row in pb.rows]
+            columns[name] = _cast_values(repeat(casts[j]), column) if casts else column
+        return {
+            "row_count": row_count,
+            "headers": headers,
+            "columns": columns,
+        }
+
+    rows = [None] * n
+    for i, row in enumerate(pb.rows):
+        rows[i] = dict(zip(headers, _row_values(row, casts)))
 
     return {
-        "row_count": response.row_count,
+        "row_count": row_count,
         "headers": headers,
         "rows": rows,
     }
 
 
-async def run_report(
+_EXACT = Filter.StringFilter.MatchType.EXACT
+
+# The most rows the Data API returns for one report request.
+_MAX_LIMIT = 250_000
+
+
+def _check_page_size(page_size: int) -> None:
+    if not 1 <= page_size <= _MAX_LIMIT:
+        raise ValueError(f"page_size must be between 1 and {_MAX_LIMIT}, got {page_size}.")
+
+
+def _report_request(
     property_id: str,
     dimensions: list[str],
     metrics: list[str],
@@ -51,21 +241,19 @@ async def run_report(
     dimension_filter_value: str | None = None,
     limit: int = 100,
     offset: int = 0,
-) -> dict:
-    """Run a GA4 report with flexible dimensions, metrics, and date ranges.
+    order_bys: list[str] | None = None,
+) -> RunReportRequest:
+    """Build a RunReportRequest (see run_report for the arguments).
 
-    Args:
-        property_id: The property ID (e.g. "123456789").
-        dimensions: List of dimension names (e.g. ["country", "city"]).
-        metrics: List of metric names (e.g. ["activeUsers", "sessions"]).
-        start_date: Start date ("YYYY-MM-DD", "NdaysAgo", "yesterday", "today").
-        end_date: End date (same format as start_date).
-        dimension_filter_name: Optional dimension name to filter on.
-        dimension_filter_value: Value to match for the filter (exact match).
-        limit: Max rows to return (default 100).
-        offset: Row offset for pagination (default 0).
+    Arguments the API would reject are rejected here with ValueError, before
+    any request is sent.
     """
-    client = _client()
+    if not dimensions and not metrics:
+        raise ValueError("At least one dimension or metric is required.")
+    if dimension_filter_name and not dimension_filter_value:
+        raise ValueError(f"dimension_filter_value is required to filter on {dimension_filter_name!r}.")
+    if limit > _MAX_LIMIT:
+        raise ValueError(f"limit must be at most {_MAX_LIMIT}, got {limit}.")
 
     request = RunReportRequest(
         property=f"properties/{property_id}",
@@ -74,27 +262,386 @@ async def run_report(
         date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
         limit=limit,
         offset=offset,
+        order_bys=[
+            OrderBy(metric=OrderBy.MetricOrderBy(metric_name=m), desc=True) for m in order_bys or ()
+        ],
     )
 
-    if dimension_filter_name and dimension_filter_value:
+    if dimension_filter_name:
         request.dimension_filter = FilterExpression(
             filter=Filter(
                 field_name=dimension_filter_name,
                 string_filter=Filter.StringFilter(
                     value=dimension_filter_value,
-                    match_type=Filter.StringFilter.MatchType.EXACT,
+                    match_type=_EXACT,
                 ),
             )
         )
 
-    response = await run_sync(client.run_report, request=request)
-    return _format_report(response)
+    return request
+
+
+async def run_report(
+    property_id: str,
+    dimensions: list[str],
+    metrics: list[str],
+    start_date: str = "28daysAgo",
+    end_date: str = "today",
+    dimension_filter_name: str | None = None,
+    dimension_filter_value: str | None = None,
+    limit: int = 100,
+    offset: int = 0,
+    order_bys: list[str] | None = None,
+    columnar: bool = False,
+    cast_metrics: bool = True,
+    use_cache: bool = True,
+    max_tries: int = 5,
+) -> dict:
+    """Run a GA4 report with flexible dimensions, metrics, and date ranges.
+
+    Reports of up to 10,000 rows whose date range ended before yesterday are
+    cached for 5 minutes.
+
+    Args:
+        property_id: The property ID (e.g. "123456789").
+        dimensions: List of dimension names (e.g. ["country", "city"]).
+        metrics: List of metric names (e.g. ["activeUsers", "sessions"]).
+        start_date: Start date ("YYYY-MM-DD", "NdaysAgo", "yesterday", "today").
+        end_date: End date (same format as start_date).
+        dimension_filter_name: Optional dimension name to filter on.
+        dimension_filter_value: Value to match for the filter (exact match).
+        limit: Max rows to return (default 100, at most 250000).
+        offset: Row offset for pagination (default 0).
+        order_bys: Metric names to sort by, descending (e.g. ["sessions"]).
+        columnar: Return {header: [values...]} columns instead of one dict per row.
+        cast_metrics: Convert metric values to int/float (default True).
+        use_cache: Set to False to skip the cache and fetch fresh data.
+        max_tries: Attempts before giving up on rate-limit/unavailable errors.
+    """
+    cacheable = not _is_live(end_date)
+    key = (
+        "report", property_id, tuple(dimensions), tuple(metrics), start_date, end_date,
+        dimension_filter_name, dimension_filter_value, limit, offset,
+        tuple(order_bys or ()), columnar, cast_metrics,
+    )
+    if cacheable and use_cache and (cached := _cache_get(key)) is not None:
+        return cached
+
+    client = _client()
+
+    request = _report_request(
+        property_id, dimensions, metrics, start_date, end_date,
+        dimension_filter_name, dimension_filter_value, limit, offset, order_bys,
+    )
+
+    response = await _with_retry(lambda: client.run_report(request=request), max_tries)
+    result = _format_report(response, columnar, cast_metrics)
+    if cacheable and len(response._pb.rows) <= _CACHE_MAX_ROWS:
+        _cache_set(key, result)
+    return result
+
+
+async def run_report_paged(
+    property_id: str,
+    dimensions: list[str],
+    metrics: list[str],
+    start_date: str = "28daysAgo",
+    end_date: str = "today",
+    dimension_filter_name: str | None = None,
+    dimension_filter_value: str | None = None,
+    order_bys: list[str] | None = None,
+    page_size: int = 100_000,
+    max_concurrency: int = 5,
+    columnar: bool = False,
+    cast_metrics: bool = True,
+    max_tries: int = 5,
+) -> dict:
+    """Run a report and return all of its rows, fetching pages concurrently.
+
+    The first page gives the total ``row_count``; the remaining pages are then
+    requested by offset, at most ``max_concurrency`` at a time, and merged in
+    order. Pass ``order_bys`` so row order is stable across pages. Takes the
+    same arguments as run_report.
+    """
+    _check_page_size(page_size)
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}.")
+
+    def page(offset: int) -> Awaitable[dict]:
+        return run_report(
+            property_id, dimensions, metrics, start_date, end_date,
+            dimension_filter_name, dimension_filter_value, page_size, offset, order_bys,
+            columnar=columnar, cast_metrics=cast_metrics, max_tries=max_tries,
+        )
+
+    first = await page(0)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(offset: int) -> dict:
+        async with semaphore:
+            return await page(offset)
+
+    pages = [first]
+    pages += await asyncio.gather(
+        *(fetch(offset) for offset in range(page_size, first["row_count"], page_size))
+    )
+
+    # Cached pages are shared, so merge into new lists.
+    if columnar:
+        merged = {
+            "columns": {
+                name: [v for p in pages for v in p["columns"][name]] for name in first["headers"]
+            }
+        }
+    else:
+        merged = {"rows": [row for p in pages for row in p["rows"]]}
+    return {"row_count": first["row_count"], "headers": first["headers"], **merged}
+
+
+async def stream_report(
+    property_id: str,
+    dimensions: list[str],
+    metrics: list[str],
+    start_date: str = "28daysAgo",
+    end_date: str = "today",
+    dimension_filter_name: str | None = None,
+    dimension_filter_value: str | None = None,
+    order_bys: list[str] | None = None,
+    page_size: int = 100_000,
+    cast_metrics: bool = True,
+    max_tries: int = 5,
+) -> AsyncIterator[dict]:
+    """Yield every row of a report as a {header: value} dict, one page at a time.
+
+    Pages of ``page_size`` rows are requested by offset until ``row_count`` rows
+    have been yielded, so only one page is held in memory at once. Takes the same
+    arguments as run_report.
+    """
+    async for pb in _report_pages(
+        property_id, dimensions, metrics, start_date, end_date,
+        dimension_filter_name, dimension_filter_value, order_bys, page_size, max_tries,
+    ):
+        headers, casts = _headers_and_casts(pb, cast_metrics)
+        for row in pb.rows:
+            yield dict(zip(headers, _row_values(row, casts)))
+
+
+async def run_report_to_ndjson(
+    path: str,
+    property_id: str,
+    dimensions: list[str],
+    metrics: list[str],
+    start_date: str = "28daysAgo",
+    end_date: str = "today",
+    dimension_filter_name: str | None = None,
+    dimension_filter_value: str | None = None,
+    order_bys: list[str] | None = None,
+    page_size: int = 100_000,
+    cast_metrics: bool = True,
+    max_tries: int = 5,
+) -> dict:
+    """Write every row of a report to ``path`` as newline-delimited JSON.
+
+    Each page is serialized straight from the protobuf rows in a worker
+    thread, without building a result dict, so memory use does not grow with
+    the report size. Rows go to a temporary file next to ``path``, which
+    replaces ``path`` only once every page has been written; on error an
+    existing file is left untouched. Takes the same arguments as run_report.
+
+    Returns:
+        {"path": ..., "row_count": rows written}
+    """
+    pages = _report_pages(
+        property_id, dimensions, metrics, start_date, end_date,
+        dimension_filter_name, dimension_filter_value, order_bys, page_size, max_tries,
+    )
+    # Validate the arguments and fetch the first page before creating any file.
+    pb = await pages.__anext__()
+    f = await run_sync(
+        tempfile.NamedTemporaryFile,
+        "wb",
+        dir=os.path.dirname(os.path.abspath(path)),
+        prefix=f".{os.path.basename(path)}.",
+        suffix=".tmp",
+        delete=False,
+    )
+    # A cancelled run_sync does not stop its worker thread, so every file
+    # operation takes this lock and cleanup waits for an in-flight write.
+    lock = threading.Lock()
+    try:
+        written = await run_sync(_write_ndjson, f, lock, pb, cast_metrics)
+        async for pb in pages:
+            written += await run_sync(_write_ndjson, f, lock, pb, cast_metrics)
+        await run_sync(_finish_ndjson, f, lock, path)
+    except BaseException:
+        await asyncio.shield(run_sync(_discard_ndjson, f, lock))
+        await pages.aclose()
+        raise
+    return {"path": path, "row_count": written}
+
+
+def _finish_ndjson(f: IO[bytes], lock: threading.Lock, path: str) -> None:
+    with lock:
+        f.close()
+        _replace_file(f.name, path)
+
+
+def _discard_ndjson(f: IO[bytes], lock: threading.Lock) -> None:
+    with lock:
+        f.close()
+        if os.path.exists(f.name):
+            os.unlink(f.name)
+
+
+def _replace_file(tmp_path: str, path: str) -> None:
+    """Move ``tmp_path`` over ``path`` with the mode a plain open() would give it.
+
+    Temporary files are created 0600; keep an existing file's mode, or apply
+    the umask to 0666 for a new one.
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    os.chmod(tmp_path, mode)
+    os.replace(tmp_path, path)
+
+
+def _write_ndjson(f: IO[bytes], lock: threading.Lock, pb, cast_metrics: bool) -> int:
+    """Write the rows of a raw report message as JSON lines; return how many."""
+    headers, casts = _headers_and_casts(pb, cast_metrics)
+    with lock:
+        if f.closed:  # discarded after the call was cancelled
+            return 0
+        write, dumps = f.write, orjson.dumps
+        for row in pb.rows:
+            write(dumps(dict(zip(headers, _row_values(row, casts))), option=orjson.OPT_APPEND_NEWLINE))
+    return len(pb.rows)
+
+
+async def _report_pages(
+    property_id: str,
+    dimensions: list[str],
+    metrics: list[str],
+    start_date: str,
+    end_date: str,
+    dimension_filter_name: str | None,
+    dimension_filter_value: str | None,
+    order_bys: list[str] | None,
+    page_size: int,
+    max_tries: int,
+) -> AsyncIterator:
+    """Yield the raw protobuf message of each page of a report, by offset."""
+    _check_page_size(page_size)
+    client = _client()
+    offset = 0
+    while True:
+        request = _report_request(
+            property_id, dimensions, metrics, start_date, end_date,
+            dimension_filter_name, dimension_filter_value, page_size, offset, order_bys,
+        )
+        response = await _with_retry(lambda: client.run_report(request=request), max_tries)
+        pb = response._pb
+        yield pb
+        offset += len(pb.rows)
+        if not pb.rows or offset >= pb.row_count:
+            return
+
+
+# The Data API accepts at most this many reports per BatchRunReports call.
+_MAX_BATCH_REPORTS = 5
+
+
+async def batch_run_reports(
+    property_id: str,
+    reports: list[dict],
+    columnar: bool = False,
+    cast_metrics: bool = True,
+    max_tries: int = 5,
+) -> list[dict]:
+    """Run several reports for one property using BatchRunReports.
+
+    Reports are sent in batches of 5 (the API limit), all batches concurrently.
+
+    Args:
+        property_id: The property ID.
+        reports: One dict per report with the run_report arguments
+            ("dimensions", "metrics", and optionally "start_date", "end_date",
+            "dimension_filter_name", "dimension_filter_value", "limit", "offset",
+            "order_bys").
+        columnar: Return {header: [values...]} columns instead of one dict per row.
+        cast_metrics: Convert metric values to int/float (default True).
+        max_tries: Attempts per batch before giving up on rate-limit/unavailable errors.
+    """
+    client = _client()
+
+    requests = [_report_request(property_id, **report) for report in reports]
+    batches = [
+        BatchRunReportsRequest(
+            property=f"properties/{property_id}",
+            requests=requests[i : i + _MAX_BATCH_REPORTS],
+        )
+        for i in range(0, len(requests), _MAX_BATCH_REPORTS)
+    ]
+
+    responses = await asyncio.gather(
+        *(
+            _with_retry(lambda batch=batch: client.batch_run_reports(request=batch), max_tries)
+            for batch in batches
+        )
+    )
+    return [
+        _format_report(report, columnar, cast_metrics)
+        for response in responses
+        for report in response.reports
+    ]
+
+
+async def run_reports_many(
+    jobs: list[dict],
+    max_concurrency: int = 10,
+    columnar: bool = False,
+    cast_metrics: bool = True,
+    max_tries: int = 5,
+) -> list[dict]:
+    """Run many reports concurrently, e.g. the same report across properties.
+
+    At most ``max_concurrency`` requests are in flight at once; as soon as one
+    finishes the next job starts. Results are returned in job order.
+
+    Args:
+        jobs: One dict per report with the run_report arguments ("property_id",
+            "dimensions", "metrics", and optionally "start_date", "end_date",
+            "dimension_filter_name", "dimension_filter_value", "limit", "offset",
+            "order_bys").
+        max_concurrency: Max concurrent requests (default 10, the GA4 per-IP
+            guideline of 10 QPS).
+        columnar: Return {header: [values...]} columns instead of one dict per row.
+        cast_metrics: Convert metric values to int/float (default True).
+        max_tries: Attempts per report before giving up on rate-limit/unavailable errors.
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}.")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(job: dict) -> dict:
+        async with semaphore:
+            return await run_report(
+                **job, columnar=columnar, cast_metrics=cast_metrics, max_tries=max_tries
+            )
+
+    return await asyncio.gather(*(run_one(job) for job in jobs))
 
 
 async def run_realtime_report(
     property_id: str,
     dimensions: list[str] | None = None,
     metrics: list[str] | None = None,
+    columnar: bool = False,
+    cast_metrics: bool = True,
+    max_tries: int = 5,
 ) -> dict:
     """Run a real-time report (active users, live events).
 
@@ -103,6 +650,9 @@ async def run_realtime_report(
         dimensions: Optional list of real-time dimensions (e.g. ["country", "unifiedScreenName"]).
         metrics: Optional list of real-time metrics (e.g. ["activeUsers", "eventCount"]).
             Defaults to ["activeUsers"] if not provided.
+        columnar: Return {header: [values...]} columns instead of one dict per row.
+        cast_metrics: Convert metric values to int/float (default True).
+        max_tries: Attempts before giving up on rate-limit/unavailable errors.
     """
     client = _client()
 
@@ -115,35 +665,55 @@ async def run_realtime_report(
         metrics=[Metric(name=m) for m in metrics],
     )
 
-    response = await run_sync(client.run_realtime_report, request=request)
-    return _format_report(response)
+    response = await _with_retry(lambda: client.run_realtime_report(request=request), max_tries)
+    return _format_report(response, columnar, cast_metrics)
 
 
-async def get_metadata(property_id: str) -> dict:
+async def get_metadata(
+    property_id: str,
+    include_descriptions: bool = False,
+    use_cache: bool = True,
+    max_tries: int = 5,
+) -> dict:
     """List all available dimensions and metrics for a GA4 property.
 
+    The result is cached for 5 minutes.
+
     Args:
         property_id: The property ID.
+        include_descriptions: Also return each field's description and category.
+        use_cache: Set to False to skip the cache and fetch fresh data.
+        max_tries: Attempts before giving up on rate-limit/unavailable errors.
     """
+    key = ("metadata", property_id, include_descriptions)
+    if use_cache and (cached := _cache_get(key)) is not None:
+        return cached
+
     client = _client()
 
-    response = await run_sync(
-        client.get_metadata,
-        request=GetMetadataRequest(name=f"properties/{property_id}/metadata"),
-    )
+    request = GetMetadataRequest(name=f"properties/{property_id}/metadata")
+    response = await _with_retry(lambda: client.get_metadata(request=request), max_tries)
+    # Raw protobuf, as in _format_report: the catalog has hundreds of entries.
+    pb = response._pb
 
-    dims = [
-        {"api_name": d.api_name, "ui_name": d.ui_name, "description": d.description, "category": d.category}
-        for d in response.dimensions
-    ]
-    mets = [
-        {"api_name": m.api_name, "ui_name": m.ui_name, "description": m.description, "category": m.category}
-        for m in response.metrics
-    ]
+    if include_descriptions:
+        dims = [
+            {"api_name": d.api_name, "ui_name": d.ui_name, "description": d.description, "category": d.category}
+            for d in pb.dimensions
+        ]
+        mets = [
+            {"api_name": m.api_name, "ui_name": m.ui_name, "description": m.description, "category": m.category}
+            for m in pb.metrics
+        ]
+    else:
+        dims = [{"api_name": d.api_name, "ui_name": d.ui_name} for d in pb.dimensions]
+        mets = [{"api_name": m.api_name, "ui_name": m.ui_name} for m in pb.metrics]
 
-    return {
-        "dimensions_count": len(dims),
-        "metrics_count": len(mets),
+    result = {
+        "dimensions_count": len(pb.dimensions),
+        "metrics_count": len(pb.metrics),
         "dimensions": dims,
         "metrics": mets,
     }
+    _cache_set(key, result)
+    return result